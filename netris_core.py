@@ -0,0 +1,303 @@
+"""Расчётная часть конфигуратора: тиры, RAID-план, имя сервера и цены (без UI)."""
+import math
+from dataclasses import dataclass, field
+from typing import Tuple, List, Dict, Union
+
+import streamlit as st
+
+# ----------------------------
+# Константы из упрощённого ТЗ
+# ----------------------------
+
+# Цены CPU+MB и памяти нужны уже при создании TIERS (см. Tier.__post_init__)
+CPU_MB_PRICE = {
+    "Intel Xeon E-2314": 82047,
+    "Intel Xeon E-2336": 98533,
+    "Intel Xeon E-2378": 109420,
+    "Intel Xeon Silver 4310": 140338,
+}
+
+RAM_PRICE_PER_8GB = 3840
+
+
+def cpu_mb_price(cpu_model: str) -> int:
+    # Берём по точному совпадению, иначе 0
+    return CPU_MB_PRICE.get(cpu_model, 0)
+
+
+def ram_price_total(ram_gb: int) -> int:
+    modules_8gb = (ram_gb + 7) // 8
+    return modules_8gb * RAM_PRICE_PER_8GB
+
+
+@dataclass(frozen=True, slots=True)
+class Tier:
+    cam_range: Tuple[int, int]
+    cores_label: str  # строкой, как в ТЗ
+    ram_gb: int
+    cpu_model: str
+    family_code: str  # код семейства CPU для имени: 5 – Xeon E, 7 – Xeon Silver
+    # Считаются один раз при создании тира
+    cpu_mb_price: int = field(init=False)
+    ram_price_total: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cpu_mb_price", cpu_mb_price(self.cpu_model))
+        object.__setattr__(self, "ram_price_total", ram_price_total(self.ram_gb))
+
+TIERS: Tuple[Tier, ...] = (
+    Tier((1, 8),   "2–4 ядра", 8,   "Intel Xeon E-2314", "5"),
+    Tier((9, 16),  "4 ядра",   8,   "Intel Xeon E-2314", "5"),
+    Tier((17, 32), "4 ядра",   16,  "Intel Xeon E-2314", "5"),
+    Tier((33, 64), "6 ядер",   32,  "Intel Xeon E-2336", "5"),
+    Tier((65, 100),"8 ядер",   64,  "Intel Xeon E-2378", "5"),
+    Tier((101, 200),"10 ядер", 64,  "Intel Xeon Silver 4310", "7"),
+    Tier((201, 400),"12 ядер", 96,  "Intel Xeon Silver 4310", "7"),
+    Tier((401, 500),"14 ядер", 128, "Intel Xeon Silver 4314", "7"),
+)
+
+# Максимум камер в поле ввода
+MAX_CAMS = 2000
+# Варианты ёмкости диска архива, ТБ
+DISK_TB_OPTIONS: Tuple[float, ...] = (4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0)
+
+# Тир по числу камер 0..MAX_CAMS: 0 → первый тир, хвост после 500 → последний
+_TIER_BY_CAMS: List[Tier] = [TIERS[-1]] * (MAX_CAMS + 1)
+_TIER_BY_CAMS[0] = TIERS[0]
+for _t in TIERS:
+    for _c in range(_t.cam_range[0], min(_t.cam_range[1], MAX_CAMS) + 1):
+        _TIER_BY_CAMS[_c] = _t
+
+# Диски под ОС: всегда 2×240 ГБ SSD в RAID1 (фиксировано по ТЗ)
+OS_STORAGE_STR = "2×240 ГБ SSD, RAID1"
+OS_NAME = "РЕД ОС"
+
+# Архив: 1,4 ТБ на 1 камеру (фиксировано)
+ARCHIVE_TB_PER_CAMERA = 1.4
+# Коэффициент заполнения массива (используем не более этого значения)
+FILL_FACTOR = 0.77
+
+# ----------------------------
+# Вспомогательные функции (имя сервера/RAID)
+# ----------------------------
+
+# Код корпуса по числу дисков 0..24 (индекс — количество дисков)
+_CHASSIS_BY_DISKS: Tuple[str, ...] = ("",) + ("2",) * 12 + ("3",) * 4 + ("4",) * 8
+
+
+def chassis_code(total_disks: int) -> str:
+    """Код корпуса по общему количеству дисков (включая hot‑spare).
+    1–12 → '2'; 13–16 → '3'; 17–24 → '4'; ≥25 → возвращаем пустую строку (нет корпуса)."""
+    if 0 < total_disks < len(_CHASSIS_BY_DISKS):
+        return _CHASSIS_BY_DISKS[total_disks]
+    return ""  # нет подходящего корпуса
+
+
+def build_server_name(cams: int, plan: Dict[str, Union[int, float, str]], chosen: Tier) -> str:
+    """Формирует имя по шаблону:
+    'Сервер LTV SR{chassis}{cpu}0-{cams}N-{usable}-R6-IR.{RAM}G.WI.CSI' (R6 — всегда, признак аппаратного контроллера)
+    Если дисков ≥25, возвращаем пустую строку — будем выводить предупреждение.
+    """
+    total_disks = int(plan.get("total_disks", 0))
+    ch = chassis_code(total_disks)
+    if not ch:
+        return ""
+    usable_int = int(round(float(plan.get("usable_tb", 0.0))))
+    raid_code = "R6"  # всегда R6: признак аппаратного контроллера в имени
+    ram = int(chosen.ram_gb)
+    return f"Сервер LTV SR{ch}{chosen.family_code}0-{cams}N-{usable_int}-{raid_code}-IR.{ram}G.WI.CSI"
+
+
+def pick_tier(num_cams: int) -> Tier:
+    if 0 <= num_cams <= MAX_CAMS:
+        return _TIER_BY_CAMS[num_cams]
+    return TIERS[-1] if num_cams > 0 else TIERS[0]
+
+
+def usable_and_level(n: int, disk_tb: float) -> Tuple[float, str, str]:
+    """Возвращает (полезная ёмкость ТБ, строка с уровнем RAID, короткий код R1/R5/R6/R60)
+    для массива из n БАЗОВЫХ дисков (не включая hot-spare).
+
+    Правила из упрощённого ТЗ:
+      • 2 шт → RAID1
+      • 3–6 → RAID5
+      • 7–16 → RAID6
+      • >16 → две группы RAID6 в RAID0 → суммарно (n-4)×disk
+    """
+    if n < 2:
+        return 0.0, "-", "R?"
+    if n == 2:
+        return 1 * disk_tb, "RAID1 (2 диска)", "R1"
+    if 3 <= n <= 6:
+        return (n - 1) * disk_tb, f"RAID5 ({n} диска)", "R5"
+    if 7 <= n <= 16:
+        return (n - 2) * disk_tb, f"RAID6 ({n} дисков)", "R6"
+
+    # >16: две группы RAID6 в RAID0 (RAID60). Разбиваем массив на две максимально равные группы.
+    # При n ≥ 17 меньшая группа ≥ 8 дисков, так что обе валидны для RAID6 и полезных (g1-2)+(g2-2) = n-4.
+    g1 = (n + 1) // 2
+    g2 = n - g1
+    return (n - 4) * disk_tb, f"RAID60 (RAID6 {g1} дисков, RAID6 {g2} дисков)", "R60"
+
+
+def plan_storage(required_effective_tb: float, disk_tb: float, fill_factor: float) -> Dict[str, Union[float, int, str]]:
+    """Подбираем минимальное число базовых дисков (без hot-spare),
+    чтобы полезная ёмкость ≥ требуемой. Для n>16 добавляются hot-spare: 1 на каждые 18 дисков.
+
+    Полезная ёмкость в каждом режиме — целое число дисков: 1 (RAID1), n-1 (RAID5), n-2 (RAID6),
+    n-4 (RAID60), поэтому n считается напрямую из требуемого числа «полезных» дисков."""
+    required_usable_tb = required_effective_tb / fill_factor
+    units = max(math.ceil(required_usable_tb / disk_tb), 1)
+    # Поправка на погрешность деления: сравниваем так же, как usable_and_level считает ёмкость
+    while units > 1 and (units - 1) * disk_tb >= required_usable_tb:
+        units -= 1
+    while units * disk_tb < required_usable_tb:
+        units += 1
+
+    if units <= 1:
+        n = 2
+    elif units <= 5:
+        n = units + 1
+    elif units <= 14:
+        n = units + 2
+    else:
+        n = units + 4
+
+    if n >= 240:
+        return {
+            "base_disks": 0,
+            "spares": 0,
+            "total_disks": 0,
+            "raid": "Невозможно подобрать (увеличьте размер диска)",
+            "raid_code": "R?",
+            "usable_tb": 0.0,
+            "required_usable_tb": required_usable_tb,
+            "raw_tb": 0.0,
+        }
+
+    usable_tb, level, raid_code = usable_and_level(n, disk_tb)
+    spares = (n + 17) // 18 if n > 16 else 0
+    total = n + spares
+    return {
+        "base_disks": n,
+        "spares": spares,
+        "total_disks": total,
+        "raid": level,
+        "raid_code": raid_code,
+        "usable_tb": usable_tb,
+        "required_usable_tb": required_usable_tb,
+        "raw_tb": total * disk_tb,
+    }
+
+# ----------------------------
+# Ценообразование (черновое)
+# ----------------------------
+
+PLATFORM_PRICE_BRACKETS = [
+    (1, 8, 81011),
+    (9, 12, 104381),
+    (13, 16, 141640),
+    (17, 24, 139535),
+]
+
+# Цена платформы по числу дисков 0..24 (индекс — количество дисков)
+_PLATFORM_PRICE_BY_DISKS: List[int] = [0] * (PLATFORM_PRICE_BRACKETS[-1][1] + 1)
+for _lo, _hi, _price in PLATFORM_PRICE_BRACKETS:
+    for _d in range(_lo, _hi + 1):
+        _PLATFORM_PRICE_BY_DISKS[_d] = _price
+
+OS_SSD_PRICE = 11312  # за 2×240 ГБ SSD
+OS_LICENSE_PRICE = 52800
+RAID_AND_CABLES_PRICE = 26000
+
+CAMERA_PRICE_PER_CAMERA = 5808
+
+HDD_PRICE_PER_DISK = {
+    4.0: 13778,
+    6.0: 15133,
+    8.0: 14734,
+    10.0: 22223,
+    12.0: 26287,
+    14.0: 25500,
+    16.0: 25000,
+    18.0: 30748,
+    20.0: 33377,
+    22.0: 42225,
+}
+
+
+# Разделитель разрядов: запятая → пробел
+_THOUSANDS_SEP = str.maketrans(",", " ")
+
+
+def fmt_rub(x: float) -> str:
+    return f"{format(int(round(x)), ',d').translate(_THOUSANDS_SEP)} ₽"
+
+
+def platform_price_by_disks(total_disks: int) -> int:
+    if 0 <= total_disks < len(_PLATFORM_PRICE_BY_DISKS):
+        return _PLATFORM_PRICE_BY_DISKS[total_disks]
+    # если больше 24 — считаем как 24+, платформы нет (будет 0), но не падаем
+    return 0
+
+
+def hdd_archive_price_total(disk_tb: float, total_disks: int) -> int:
+    per = HDD_PRICE_PER_DISK.get(float(disk_tb), 0)
+    return per * int(total_disks)
+
+
+def markup_rub(total: int, percent: int) -> int:
+    """total × percent/100 в целых рублях; округление как у round() (половина — к чётному)."""
+    q, r = divmod(total * percent, 100)
+    return q + (r > 50 or (r == 50 and q % 2))
+
+
+def calc_prices(plan: Dict[str, Union[int, float, str]], chosen: Tier, disk_tb: float, cams: int) -> Dict[str, int]:
+    total_disks = int(plan.get("total_disks", 0))
+
+    platform = platform_price_by_disks(total_disks)
+    hdd_archive = hdd_archive_price_total(disk_tb, total_disks)
+    cams_cost = cams * CAMERA_PRICE_PER_CAMERA
+
+    core_sum = (platform + chosen.cpu_mb_price + chosen.ram_price_total + OS_SSD_PRICE
+                + hdd_archive + OS_LICENSE_PRICE + RAID_AND_CABLES_PRICE)
+    total_sum = core_sum + cams_cost
+
+    return {
+        "in_price": total_sum,
+        "mpc": markup_rub(total_sum, 153),
+        "rpc": total_sum * 2,
+        "breakdown": {
+            "platform": platform,
+            "cpu_mb": chosen.cpu_mb_price,
+            "ram": chosen.ram_price_total,
+            "os_ssd": OS_SSD_PRICE,
+            "hdd_archive": hdd_archive,
+            "os_license": OS_LICENSE_PRICE,
+            "raid_bundle": RAID_AND_CABLES_PRICE,
+            "cameras": cams_cost,
+        },
+    }
+
+# ----------------------------
+# Полный расчёт конфигурации
+# ----------------------------
+
+def compute_all(cams: int, disk_tb: float) -> Tuple[Tier, Dict[str, Union[int, float, str]], Dict[str, int], str]:
+    """Тир, план массива, цены и имя сервера для (камеры, ёмкость диска)."""
+    chosen = pick_tier(cams)
+    plan = plan_storage(cams * ARCHIVE_TB_PER_CAMERA, disk_tb, FILL_FACTOR)
+    prices = calc_prices(plan, chosen, disk_tb, cams)
+    server_name = build_server_name(cams, plan, chosen)
+    return chosen, plan, prices, server_name
+
+
+@st.cache_resource(show_spinner=False)
+def config_table() -> Dict[Tuple[int, float], Tuple[Tier, Dict[str, Union[int, float, str]], Dict[str, int], str]]:
+    """Все результаты compute_all для 1..MAX_CAMS × DISK_TB_OPTIONS (20 000 вариантов).
+    Строится один раз на процесс и общий для всех сессий; результаты только читаются."""
+    return {
+        (cams, disk_tb): compute_all(cams, disk_tb)
+        for cams in range(1, MAX_CAMS + 1)
+        for disk_tb in DISK_TB_OPTIONS
+    }